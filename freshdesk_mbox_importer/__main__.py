@@ -1,17 +1,60 @@
-import sys
+import argparse
 from .importer import sync
 
-def run() -> None:
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer option."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+def run(
+    purge: bool = False,
+    create_group: bool = False,
+    concurrency: int | None = None,
+    batch_size: int | None = None,
+) -> None:
     """Entry point for the Freshdesk MBOX Importer."""
-    sync()
+    sync(purge=purge, create_group=create_group, concurrency=concurrency, batch_size=batch_size)
 
 def main() -> None:
     """CLI dispatcher."""
-    if len(sys.argv) == 2 and sys.argv[1] == "run":
-        run()
-    else:
-        sys.stderr.write("Usage: python -m freshdesk_mbox_importer run\n")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(prog="python -m freshdesk_mbox_importer")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_cmd = commands.add_parser("run", help="import the configured mbox into Freshdesk")
+    run_cmd.add_argument(
+        "--purge",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="drop saved progress and start a fresh import (default: resume)",
+    )
+    run_cmd.add_argument(
+        "--create-group",
+        action="store_true",
+        help="create the import group in Freshdesk if it does not exist",
+    )
+    run_cmd.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        metavar="N",
+        help="maximum tickets pushed at once (default: MAX_CONCURRENCY)",
+    )
+    run_cmd.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        metavar="N",
+        help="imported threads recorded per progress commit (default: BATCH_SIZE)",
+    )
+    args = parser.parse_args()
+    run(
+        purge=args.purge,
+        create_group=args.create_group,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+    )
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,29 @@
-"""Freshdesk MBOX Importer with SQLite resume, purge prompt and progress bar"""
+"""Freshdesk MBOX Importer with SQLite resume, purge option and progress bar"""
 
-import time
-import mailbox
+import asyncio
+import atexit
+import functools
+import mmap
+import os
 import re
 import html
 import sqlite3
+import time
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from email.utils import parseaddr, parsedate_to_datetime
 from email.header import decode_header
-import signal
+from email.parser import BytesHeaderParser, BytesParser
 import sys
 
 import httpx
-from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
-from pydantic import BaseModel, Field
+import orjson
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from .settings import ImporterSettings
 
@@ -23,26 +32,74 @@ try:
 except ModuleNotFoundError:
     tqdm = None  # type: ignore
 
-settings = ImporterSettings()
 _DB_PATH = Path(".fd_progress.db")
-_SPAM_ADDR = re.compile(r"(mailer-daemon@|postmaster@|no[-_]reply@)", re.I)
-_SKIP_LABELS = {"spam", "trash"}
+_META_TTL = 3600
+# Sort key for messages whose Date header is missing or unparseable.
+_NO_DATE = datetime.min.replace(tzinfo=timezone.utc)
+# One pass over "<sender>\0<labels>\1<precedence>\1": robot sender address,
+# a spam/trash Gmail label, or a bulk/junk/list precedence. Each alternative
+# is anchored to its own segment.
+_SPAM_RE = re.compile(
+    r"\A[^\x00]*(?:mailer-daemon|postmaster|no[-_]reply)@"
+    r"|\A[^\x00]*\x00(?:[^\x01]*,)?\s*(?:spam|trash)\s*[,\x01]"
+    r"|\x01(?:bulk|junk|list)\x01\Z",
+    re.I,
+)
+_AUTO_SUBMITTED_OK = frozenset({"", "no"})
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
 _HTML_RE = re.compile(r"<[a-z][\s\S]*>", re.I | re.M)
+_HTML_TRANS = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;", "\n": "<br>"}
+)
+_FROM_LINE = re.compile(rb"^From ", re.M)
+_HEADER_PARSER = BytesHeaderParser()
+_PARSER = BytesParser()
+
+
+@functools.cache
+def _settings() -> ImporterSettings:
+    """Load settings on first use so importing the package needs no .env."""
+    return ImporterSettings()
+
+
+def _base_url() -> str:
+    """Return the Freshdesk account URL."""
+    return f"https://{_settings().fd_domain}.freshdesk.com"
+
+
+@functools.cache
+def _client() -> httpx.Client:
+    """Return the shared keep-alive client for Freshdesk lookups."""
+    client = httpx.Client(
+        base_url=_base_url(),
+        auth=(_settings().fd_key, "X"),
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+    )
+    atexit.register(client.close)
+    return client
 
 
-class TicketPayload(BaseModel):
+@dataclass(slots=True)
+class TicketPayload:
     """Payload sent to Freshdesk."""
-    email: str | None = None
-    name: str | None = None
     subject: str
     description: str
+    email: str | None = None
+    name: str | None = None
     status: int = 5
     priority: int = 1
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
     group_id: int | None = None
-    custom_fields: dict = Field(default_factory=dict)
+    custom_fields: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Return the JSON body, omitting fields left as None."""
+        return {f.name: v for f in fields(self) if (v := getattr(self, f.name)) is not None}
 
 
+@functools.lru_cache(maxsize=4096)
 def _decode(text: str) -> str:
     """Decode RFC-2047 header text."""
     parts = decode_header(text or "")
@@ -53,79 +110,174 @@ def _decode(text: str) -> str:
 
 
 def _is_spam(headers: dict) -> bool:
-    """Return True if the message should be skipped."""
-    labels = {l.strip().lower() for l in headers.get("X-Gmail-Labels", "").split(",")}
-    if labels & _SKIP_LABELS:
-        return True
-    if headers.get("Precedence", "").lower() in {"bulk", "junk", "list"}:
-        return True
-    if headers.get("Auto-Submitted", "").lower() not in {"", "no"}:
+    """Return True if the message should be skipped.
+
+    Checks are ordered by how often they reject a message.
+    """
+    sender = parseaddr(headers.get("From", ""))[1]
+    probe = f"{sender}\x00{headers.get('X-Gmail-Labels', '')}\x01{headers.get('Precedence', '')}\x01"
+    if _SPAM_RE.search(probe):
         return True
-    if "all" in headers.get("X-Auto-Response-Suppress", "").lower():
+    if headers.get("Auto-Submitted", "").lower() not in _AUTO_SUBMITTED_OK:
         return True
-    sender = parseaddr(headers.get("From", ""))[1]
-    return bool(_SPAM_ADDR.search(sender))
+    return "all" in headers.get("X-Auto-Response-Suppress", "").lower()
+
+
+def _parse_chunk(path: str, start: int, end: int) -> list[tuple[dict, str]]:
+    """Return headers and body of each non-spam, non-empty message in a byte range.
+
+    ``start`` must be the offset of a ``From`` line; only headers are parsed
+    up front so spam bodies are never decoded.
+    """
+    out: list[tuple[dict, str]] = []
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        starts = [m.start() for m in _FROM_LINE.finditer(mm, start, end)]
+        for msg_start, msg_end in zip(starts, starts[1:] + [end]):
+            eol = mm.find(b"\n", msg_start, msg_end)
+            if eol < 0:
+                continue
+            raw = mm[eol + 1 : msg_end]
+            if raw.endswith(b"\n"):
+                raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1]
+            hdrs = {sys.intern(k): str(v) for k, v in _HEADER_PARSER.parsebytes(raw, headersonly=True).items()}
+            if _is_spam(hdrs):
+                continue
+            payload = _PARSER.parsebytes(raw).get_payload(decode=True)
+            body = payload.decode(errors="replace") if isinstance(payload, bytes) else str(payload or "")
+            if not body.strip():
+                continue
+            out.append((hdrs, body))
+    return out
+
+
+def _chunk_bounds(path: str, parts: int) -> list[int]:
+    """Split the mbox into up to ``parts`` byte ranges aligned on ``From`` lines."""
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        first = _FROM_LINE.search(mm)
+        if not first:
+            return []
+        bounds = [first.start()]
+        for i in range(1, parts):
+            m = _FROM_LINE.search(mm, max(size * i // parts, bounds[-1] + 1))
+            if not m:
+                break
+            bounds.append(m.start())
+    return bounds + [size]
 
 
 def iter_messages(path: str) -> Iterable[tuple[dict, str]]:
-    """Yield headers and body for each non-empty message."""
-    for msg in mailbox.mbox(path):
-        hdrs = dict(msg.items())
-        payload = msg.get_payload(decode=True)
-        body = payload.decode(errors="replace") if isinstance(payload, bytes) else str(payload or "")
-        if not body.strip():
-            continue
-        yield hdrs, body
+    """Yield headers and body for each non-spam, non-empty message.
+
+    The mbox is memory-mapped and cut into one byte range per CPU, which are
+    parsed in worker processes; results are yielded as each range completes.
+    """
+    if not Path(path).stat().st_size:
+        return
+    bounds = _chunk_bounds(path, os.cpu_count() or 1)
+    ranges = list(zip(bounds, bounds[1:]))
+    if len(ranges) <= 1:
+        for start, end in ranges:
+            yield from _parse_chunk(path, start, end)
+        return
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [pool.submit(_parse_chunk, path, start, end) for start, end in ranges]
+        for fut in as_completed(futures):
+            yield from fut.result()
+
+
+def _meta_get(conn: sqlite3.Connection, key: str) -> str | None:
+    """Return a cached Freshdesk lookup if it is younger than ``_META_TTL``."""
+    row = conn.execute("SELECT value, ts FROM meta WHERE key = ?", (key,)).fetchone()
+    if row and time.time() - row[1] < _META_TTL:
+        return row[0]
+    return None
 
 
-def ensure_custom_field() -> None:
+def _meta_set(conn: sqlite3.Connection, key: str, value: str) -> None:
+    """Cache a Freshdesk lookup in the progress database."""
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO meta(key, value, ts) VALUES (?, ?, ?)", (key, value, time.time()))
+
+
+def ensure_custom_field(conn: sqlite3.Connection) -> None:
     """Abort if the required custom date field is absent."""
-    url = f"https://{settings.fd_domain}.freshdesk.com/api/v2/ticket_fields"
-    resp = httpx.get(url, auth=(settings.fd_key, "X"))
+    field_name = _settings().original_date_field
+    key = f"{_settings().fd_domain}:ticket_field:{field_name}"
+    if _meta_get(conn, key):
+        return
+    resp = _client().get("/api/v2/ticket_fields")
     resp.raise_for_status()
-    names = {f["name"] for f in resp.json()}
-    if settings.original_date_field not in names:
-        raise RuntimeError(f"Create a Date field named {settings.original_date_field!r} in Freshdesk")
+    names = {f["name"] for f in orjson.loads(resp.content)}
+    if field_name not in names:
+        raise RuntimeError(f"Create a Date field named {field_name!r} in Freshdesk")
+    _meta_set(conn, key, "1")
 
 
-def ensure_import_group() -> int:
-    """Return the ID of the import group, prompting if missing."""
-    url = f"https://{settings.fd_domain}.freshdesk.com/api/v2/groups"
-    resp = httpx.get(url, auth=(settings.fd_key, "X"))
+def ensure_import_group(conn: sqlite3.Connection, create: bool = False) -> int:
+    """Return the ID of the import group, creating it if missing and ``create`` is set."""
+    group_name = _settings().import_group_name
+    key = f"{_settings().fd_domain}:group:{group_name}"
+    cached = _meta_get(conn, key)
+    if cached:
+        return int(cached)
+    resp = _client().get("/api/v2/groups")
     resp.raise_for_status()
-    for g in resp.json():
-        if g.get("name") == settings.import_group_name:
+    for g in orjson.loads(resp.content):
+        if g.get("name") == group_name:
+            _meta_set(conn, key, str(g["id"]))
             return g["id"]
-    input(f"Group '{settings.import_group_name}' not found. Create it in Admin → Groups then press Enter to continue…")
-    resp = httpx.get(url, auth=(settings.fd_key, "X"))
+    if not create:
+        raise RuntimeError(
+            f"Group '{group_name}' not found. Create it in Admin → Groups or re-run with --create-group"
+        )
+    resp = _client().post(
+        "/api/v2/groups",
+        content=orjson.dumps({"name": group_name}),
+        headers={"Content-Type": "application/json"},
+    )
     resp.raise_for_status()
-    for g in resp.json():
-        if g.get("name") == settings.import_group_name:
-            return g["id"]
-    raise RuntimeError(f"Group '{settings.import_group_name}' is missing")
+    group_id = orjson.loads(resp.content)["id"]
+    _meta_set(conn, key, str(group_id))
+    return group_id
 
 
-def _html_block(headers: dict, body: str) -> str:
-    """Return an HTML fragment for one e-mail."""
-    ts = parsedate_to_datetime(headers.get("Date", "")).isoformat(" ", "seconds")
+def _html_block_parts(sent_at: datetime, headers: dict, body: str, out: list[str]) -> None:
+    """Append the HTML fragments for one e-mail to ``out``."""
+    stamp = "" if sent_at is _NO_DATE else sent_at.isoformat(" ", "seconds")
     sender = _decode(headers.get("From", "")).strip()
-    head = f"<strong>{html.escape(ts)}"
-    if sender:
-        head += f" {html.escape(sender)}"
-    head += "</strong>"
+    out += ("<p><strong>", html.escape(" ".join(filter(None, (stamp, sender)))))
     if _HTML_RE.search(body):
-        return f"<p>{head}</p>{body}"
-    body_html = html.escape(body).replace("\n", "<br>")
-    return f"<p>{head}<br>{body_html}</p>"
+        out += ("</strong></p>", body)
+    else:
+        out += ("</strong><br>", body.translate(_HTML_TRANS), "</p>")
+
+
+def _sent_at(headers: dict) -> datetime:
+    """Return the Date header as an aware datetime, or ``_NO_DATE`` if it is missing or invalid.
+
+    A ``-0000`` zone parses as naive; it is taken as UTC so a thread can mix both.
+    """
+    try:
+        dt = parsedate_to_datetime(headers.get("Date", ""))
+    except (TypeError, ValueError):
+        return _NO_DATE
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
 def build_thread_ticket(messages: list[tuple[dict, str]], group_id: int) -> TicketPayload:
     """Return one ticket covering a Gmail thread."""
-    messages.sort(key=lambda m: parsedate_to_datetime(m[0].get("Date", "")))
-    first_hdrs, _ = messages[0]
-    description = "<hr>".join(_html_block(h, b) for h, b in messages)
+    dated = [(_sent_at(h), h, b) for h, b in messages]
+    dated.sort(key=itemgetter(0))
+    _, first_hdrs, _ = dated[0]
+    sent_at = next((dt for dt, _, _ in dated if dt is not _NO_DATE), None)
+    parts: list[str] = []
+    for dt, h, b in dated:
+        if parts:
+            parts.append("<hr>")
+        _html_block_parts(dt, h, b, parts)
+    description = "".join(parts)
     real_name, sender_email = parseaddr(first_hdrs.get("From", ""))
-    sent_at = parsedate_to_datetime(first_hdrs.get("Date", ""))
     return TicketPayload(
         email=sender_email or None,
         name=_decode(real_name).strip() or None,
@@ -133,75 +285,229 @@ def build_thread_ticket(messages: list[tuple[dict, str]], group_id: int) -> Tick
         description=description,
         group_id=group_id,
         tags=["imported"],
-        custom_fields={settings.original_date_field: sent_at.date().isoformat()},
+        custom_fields={_settings().original_date_field: sent_at.date().isoformat()} if sent_at else {},
     )
 
 
+class _TokenBucket:
+    """Space requests ``interval`` seconds apart across concurrent tasks."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next = 0.0
+
+    def defer(self, delay: float) -> None:
+        """Hold back every caller for at least ``delay`` seconds from now."""
+        self._next = max(self._next, time.monotonic() + delay)
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Return the Retry-After delay of a 429 response, if it has one."""
+    if resp.status_code != 429:
+        return None
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport failures, rate limiting and transient server errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRY_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+_backoff = wait_exponential_jitter(initial=1, max=60)
+
+
+def _wait(retry_state: RetryCallState) -> float:
+    """Honour Retry-After on 429, otherwise back off exponentially with jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        delay = _retry_after(exc.response)
+        if delay is not None:
+            return delay
+    return _backoff(retry_state)
+
+
 @retry(
-    wait=wait_exponential(min=1, max=60),
+    wait=_wait,
     stop=stop_after_attempt(5),
-    retry=retry_if_exception_type(httpx.HTTPError),
+    retry=retry_if_exception(_is_retryable),
     reraise=True,
 )
-def push(ticket: TicketPayload) -> None:
+async def push(client: httpx.AsyncClient, bucket: _TokenBucket, ticket: TicketPayload) -> None:
     """Create one ticket with retries and back-off."""
-    url = f"https://{settings.fd_domain}.freshdesk.com/api/v2/tickets"
-    httpx.post(url, auth=(settings.fd_key, "X"), json=ticket.model_dump(exclude_none=True)).raise_for_status()
+    await bucket.acquire()
+    resp = await client.post(
+        "/api/v2/tickets",
+        content=orjson.dumps(ticket.to_dict()),
+        headers={"Content-Type": "application/json"},
+    )
+    delay = _retry_after(resp)
+    if delay is not None:
+        bucket.defer(delay)
+    resp.raise_for_status()
 
 
 def _init_db(purge: bool) -> sqlite3.Connection:
     """Initialize or purge the progress database."""
     conn = sqlite3.connect(_DB_PATH)
-    cur = conn.cursor()
-    if purge:
-        cur.execute("DROP TABLE IF EXISTS processed")
-    cur.execute("CREATE TABLE IF NOT EXISTS processed(thread_id TEXT PRIMARY KEY)")
-    conn.commit()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA busy_timeout=5000")
+    with conn:
+        if purge:
+            conn.execute("DROP TABLE IF EXISTS processed")
+            conn.execute("DROP TABLE IF EXISTS meta")
+        conn.execute("CREATE TABLE IF NOT EXISTS processed(thread_id TEXT PRIMARY KEY)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT, ts REAL)")
     return conn
 
 
-def _handle_interrupt(signum, frame) -> None:
-    """Catch SIGINT to exit cleanly."""
-    raise KeyboardInterrupt
+def _flush(conn: sqlite3.Connection, pending: list[tuple[str]]) -> None:
+    """Record a batch of processed thread ids in one transaction."""
+    if not pending:
+        return
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO processed(thread_id) VALUES (?)", pending)
+    pending.clear()
+
+
+async def _push_thread(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    bucket: _TokenBucket,
+    conn: sqlite3.Connection,
+    pending: list[tuple[str]],
+    failed: list[str],
+    batch_size: int,
+    group_id: int,
+    tid: str,
+    messages: list[tuple[dict, str]],
+    bar,
+) -> None:
+    """Build and push one thread's ticket, then queue it as processed.
+
+    A thread that cannot be built, or still fails after retries, is reported
+    and left out of the progress database without cancelling the other uploads.
+    """
+    try:
+        ticket = build_thread_ticket(messages, group_id)
+        async with sem:
+            await push(client, bucket, ticket)
+    except Exception as exc:
+        failed.append(tid)
+        message = f"Thread {tid} failed: {exc}"
+        if bar:
+            tqdm.write(message, file=sys.stderr)
+        else:
+            print(message, file=sys.stderr)
+    else:
+        pending.append((tid,))
+        if len(pending) >= batch_size:
+            _flush(conn, pending)
+    if bar:
+        bar.update()
+
 
+async def _push_all(
+    threads: dict[str, list[tuple[dict, str]]],
+    group_id: int,
+    conn: sqlite3.Connection,
+    concurrency: int,
+    batch_size: int,
+) -> list[str]:
+    """Push all pending tickets over one pooled client, up to ``concurrency`` at once.
 
-def sync() -> None:
-    """Main driver with SQLite resume, progress bar and duplicate avoidance."""
-    signal.signal(signal.SIGINT, _handle_interrupt)
-    purge = input("Purge progress database? [y/N]: ").strip().lower() == "y"
+    Return the ids of threads that could not be imported.
+    """
+    cfg = _settings()
+    sem = asyncio.Semaphore(concurrency)
+    bucket = _TokenBucket(cfg.rate_delay)
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        keepalive_expiry=60,
+    )
+    bar = tqdm(total=len(threads), desc="Importing threads", unit="thread") if tqdm else None
+    pending: list[tuple[str]] = []
+    failed: list[str] = []
+    try:
+        async with httpx.AsyncClient(
+            base_url=_base_url(),
+            auth=(cfg.fd_key, "X"),
+            http2=True,
+            limits=limits,
+            timeout=30,
+        ) as client:
+            async with asyncio.TaskGroup() as tg:
+                for tid, messages in threads.items():
+                    tg.create_task(
+                        _push_thread(
+                            client, sem, bucket, conn, pending, failed, batch_size, group_id, tid, messages, bar
+                        )
+                    )
+    finally:
+        _flush(conn, pending)
+        if bar:
+            bar.close()
+    return failed
+
+
+def sync(
+    purge: bool = False,
+    create_group: bool = False,
+    concurrency: int | None = None,
+    batch_size: int | None = None,
+) -> None:
+    """Main driver with SQLite resume, progress bar and duplicate avoidance.
+
+    ``concurrency`` and ``batch_size`` override the configured
+    ``max_concurrency`` and ``batch_size`` when given.
+    """
+    cfg = _settings()
     conn = _init_db(purge)
-    cur = conn.cursor()
-    ensure_custom_field()
-    group_id = ensure_import_group()
-    items: list[tuple[str, dict, str]] = []
-    for headers, body in iter_messages(settings.mbox_path):
-        if _is_spam(headers):
-            continue
-        tid = str(headers.get("X-GM-THRID") or headers.get("Message-ID") or id(headers))
-        cur.execute("SELECT 1 FROM processed WHERE thread_id = ?", (tid,))
-        if cur.fetchone():
-            continue
-        items.append((tid, headers, body))
-    if not items:
-        print("Nothing new to import")
-        return
-    iterator = items
-    if tqdm:
-        iterator = tqdm(items, desc="Importing threads", unit="thread")
     try:
-        for tid, hdrs, body in iterator:
-            push(build_thread_ticket([(hdrs, body)], group_id))
-            cur.execute(  # type: ignore
-                "INSERT OR IGNORE INTO processed(thread_id) VALUES (?)", (tid,)
+        ensure_custom_field(conn)
+        group_id = ensure_import_group(conn, create=create_group)
+        seen = {row[0] for row in conn.execute("SELECT thread_id FROM processed")}
+        threads: dict[str, list[tuple[dict, str]]] = defaultdict(list)
+        for headers, body in iter_messages(cfg.mbox_path):
+            tid = str(headers.get("X-GM-THRID") or headers.get("Message-ID") or id(headers))
+            if tid in seen:
+                continue
+            threads[tid].append((headers, body))
+        if not threads:
+            print("Nothing new to import")
+            return
+        try:
+            failed = asyncio.run(
+                _push_all(
+                    threads,
+                    group_id,
+                    conn,
+                    concurrency or cfg.max_concurrency,
+                    batch_size or cfg.batch_size,
+                )
             )
-            conn.commit()
-            time.sleep(settings.rate_delay)
-    except KeyboardInterrupt:
-        conn.commit()
-        print("\nInterrupted — progress saved. Re-run to resume.")
+        except KeyboardInterrupt:
+            print("\nInterrupted — progress saved. Re-run to resume.")
+            sys.exit(1)
+    finally:
+        conn.close()
+    if failed:
+        print(f"{len(failed)} thread(s) failed — progress saved. Re-run to retry them.")
         sys.exit(1)
-    conn.close()
     _DB_PATH.unlink(missing_ok=True)
     print("Import complete without duplicates")
-
-
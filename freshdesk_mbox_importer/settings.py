@@ -9,6 +9,8 @@ class ImporterSettings(BaseSettings):
     mbox_path: str = "takeout.mbox"
     original_date_field: str = "cf_original_date"
     rate_delay: float = 0.8
+    max_concurrency: int = 4
+    batch_size: int = 100
     mbox_owner_email: str
     import_group_name: str = "imported"
 
@@ -0,0 +1,26 @@
+import pytest
+
+from freshdesk_mbox_importer import importer
+from freshdesk_mbox_importer.importer import build_thread_ticket
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FD_DOMAIN", "example")
+    monkeypatch.setenv("FD_KEY", "key")
+    monkeypatch.setenv("MBOX_OWNER_EMAIL", "owner@example.com")
+    importer._settings.cache_clear()
+    yield
+    importer._settings.cache_clear()
+
+
+def test_thread_mixing_naive_and_aware_dates():
+    messages = [
+        ({"Date": "Mon, 1 Jan 2024 12:00:00 +0000", "From": "b@example.com", "Subject": "Re: hi"}, "second"),
+        ({"Date": "Mon, 1 Jan 2024 10:00:00 -0000", "From": "a@example.com", "Subject": "hi"}, "first"),
+    ]
+    ticket = build_thread_ticket(messages, group_id=1)
+    assert ticket.email == "a@example.com"
+    assert ticket.description.index("first") < ticket.description.index("second")
+    assert ticket.custom_fields == {"cf_original_date": "2024-01-01"}